@@ -2,10 +2,17 @@
 EASA Part-145 Compliance Platform - Professional Web Interface
 """
 from flask import Flask, render_template, jsonify, request, send_from_directory
-import json
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+import hashlib
+import gzip
+import orjson
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
+from functools import lru_cache
+from collections import defaultdict
+import re
+from werkzeug.exceptions import NotFound
 from werkzeug.utils import secure_filename
 import tempfile
 import os
@@ -15,42 +22,149 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json module.
+
+    sort_keys is honoured like the default provider; ensure_ascii is not, since
+    orjson always emits UTF-8.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj, **kwargs).decode()
+
+    def dumps_bytes(self, obj, **kwargs):
+        """Serialize to UTF-8 bytes, for callers that would only encode the str again."""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 32 * 1024 * 1024  # 32MB max file size
 app.config['UPLOAD_FOLDER'] = tempfile.gettempdir()
 app.config['ALLOWED_EXTENSIONS'] = {'pdf', 'doc', 'docx', 'txt', 'md'}
 
+# Compress JSON and HTML responses above 1 KB (gzip/brotli negotiated per request)
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+# Leave files streamed by send_from_directory alone so they keep sendfile and conditional GETs
+app.config['COMPRESS_STREAMS'] = False
+Compress(app)
+
+# Bound once so allowed_file doesn't go through app.config on every upload
+ALLOWED_SUFFIXES = frozenset(f".{ext}" for ext in app.config['ALLOWED_EXTENSIONS'])
+
+# Reports are listed and served from the same directory, resolved against the working directory
+OUTPUT_DIR = os.path.abspath("outputs")
+
+REPORT_TIMESTAMP_RE = re.compile(r'[0-9]{8}_[0-9]{6}')
+REPORT_FILENAME_RE = re.compile(r'compliance_report_[0-9]{8}_[0-9]{6}\.json')
+# A content hash must contain a letter, so date stamps like photo-20240101.png don't count
+HASHED_ASSET_RE = re.compile(r'(?:[\w-]+/)*[\w-]+[.-](?=[0-9]*[a-f])[0-9a-f]{8,}\.\w+')
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60  # 1 year
+SHORT_MAX_AGE = 5 * 60  # 5 minutes
+
 def allowed_file(filename):
     """Check if file extension is allowed."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+    return os.path.splitext(filename)[1].lower() in ALLOWED_SUFFIXES
 
-def get_latest_report():
-    """Get the most recent compliance report."""
-    output_dir = Path("outputs")
-    if not output_dir.exists():
-        return None
-    
-    json_files = list(output_dir.glob("compliance_report_*.json"))
+def static_json_response(body, gzipped, etag):
+    """Return pre-serialized JSON bytes, answering 304 when the client's ETag matches.
+    
+    Clients that accept gzip get the pre-compressed body, which Flask-Compress
+    passes through untouched because Content-Encoding is already set.
+    """
+    if request.accept_encodings['gzip']:
+        response = app.response_class(gzipped, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        etag = f"{etag}-gzip"
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+@lru_cache(maxsize=8)
+def _load_report_cached(path_str, mtime_ns):
+    """Parse a report file. Keyed on mtime so a rewritten report is reloaded."""
+    return orjson.loads(Path(path_str).read_bytes())
+
+def scan_report_files():
+    """List the compliance report JSON files in outputs/ in a single scandir pass."""
+    try:
+        with os.scandir(OUTPUT_DIR) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.startswith("compliance_report_") and entry.name.endswith(".json")
+            ]
+    except FileNotFoundError:
+        return []
+
+def get_latest_report_key():
+    """Get the (path, mtime_ns) cache key of the most recent compliance report."""
+    json_files = scan_report_files()
     if not json_files:
         return None
     
-    # Sort by modification time, newest first
-    latest_file = max(json_files, key=lambda p: p.stat().st_mtime)
-    
-    with open(latest_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # DirEntry caches its stat result, so each file is stat'ed once
+    latest_file = max(json_files, key=lambda e: e.stat().st_mtime)
+    return latest_file.path, latest_file.stat().st_mtime_ns
 
-def get_all_reports():
-    """Get list of all available reports."""
-    output_dir = Path("outputs")
-    if not output_dir.exists():
-        return []
+def report_etag(key):
+    """Build the ETag value for a report version from its filename and mtime."""
+    path_str, mtime_ns = key
+    return f"{os.path.basename(path_str)}-{mtime_ns}"
+
+def add_report_cache_headers(response, key):
+    """Tag a response with a weak ETag identifying the report version."""
+    response.set_etag(report_etag(key), weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def client_has_report(key):
+    """Check whether the request's If-None-Match already covers this report version."""
+    return request.if_none_match.contains_weak(report_etag(key))
+
+def latest_report_response(build):
+    """Respond with build(path, mtime_ns) for the latest report, or 304 if the client has it."""
+    key = get_latest_report_key()
+    if key and client_has_report(key):
+        return add_report_cache_headers(app.response_class(status=304), key)
+    
+    payload = build(*key) if key else None
+    if not payload:
+        return jsonify({"error": "No reports found"}), 404
     
+    return add_report_cache_headers(jsonify(payload), key)
+
+def parse_report_timestamp(timestamp):
+    """Parse a YYYYmmdd_HHMMSS report timestamp without going through strptime."""
+    if not REPORT_TIMESTAMP_RE.fullmatch(timestamp):
+        raise ValueError(f"Invalid report timestamp: {timestamp!r}")
+    return datetime(
+        int(timestamp[0:4]), int(timestamp[4:6]), int(timestamp[6:8]),
+        int(timestamp[9:11]), int(timestamp[11:13]), int(timestamp[13:15])
+    )
+
+@lru_cache(maxsize=1)
+def _reports_listing(dir_mtime_ns):
+    """Build the report listing. Keyed on the outputs/ mtime, which changes when reports are added or removed."""
     reports = []
-    for json_file in output_dir.glob("compliance_report_*.json"):
-        timestamp = json_file.stem.replace("compliance_report_", "")
+    for json_file in scan_report_files():
+        timestamp = json_file.name[len("compliance_report_"):-len(".json")]
         try:
-            dt = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
+            dt = parse_report_timestamp(timestamp)
             reports.append({
                 "filename": json_file.name,
                 "timestamp": timestamp,
@@ -61,7 +175,15 @@ def get_all_reports():
     
     # Sort by date, newest first
     reports.sort(key=lambda x: x["timestamp"], reverse=True)
-    return reports
+    return tuple(reports)
+
+def get_all_reports():
+    """Get list of all available reports."""
+    try:
+        dir_mtime_ns = os.stat(OUTPUT_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return list(_reports_listing(dir_mtime_ns))
 
 @app.route('/')
 def index():
@@ -77,35 +199,55 @@ def list_reports():
 @app.route('/api/report/<filename>')
 def get_report(filename):
     """API endpoint to get a specific report."""
-    output_dir = Path("outputs")
-    report_path = output_dir / filename
-    
-    if not report_path.exists() or not filename.startswith("compliance_report_"):
+    # Reject anything that isn't a report filename before touching the disk
+    if not REPORT_FILENAME_RE.fullmatch(filename):
         return jsonify({"error": "Report not found"}), 404
     
-    with open(report_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    return jsonify(data)
+    # The file on disk is already the JSON the client wants, so stream it as-is
+    try:
+        return send_from_directory(OUTPUT_DIR, filename, mimetype='application/json', conditional=True, max_age=0)
+    except NotFound:
+        return jsonify({"error": "Report not found"}), 404
 
 @app.route('/api/latest')
 def get_latest():
     """API endpoint to get the latest report."""
-    report = get_latest_report()
-    if not report:
-        return jsonify({"error": "No reports found"}), 404
-    
-    return jsonify(report)
+    return latest_report_response(_load_report_cached)
 
-@app.route('/api/summary')
-def get_summary():
-    """API endpoint to get summary statistics."""
-    report = get_latest_report()
+def findings_frame(findings):
+    """Load findings into a DataFrame with one column per aggregated field.
+    
+    List fields are reduced to their lengths, missing values get the same
+    defaults the per-finding .get() calls used, and confidence_bucket holds the
+    low (< 0.6) / medium (< 0.8) / high bucket of each confidence score.
+    """
+    # Imported lazily so cold starts that never aggregate don't pay for pandas
+    import pandas as pd
+    
+    df = pd.DataFrame(findings, columns=["status", "confidence_score", "gaps_identified", "auditor_questions"])
+    df["status"] = df["status"].fillna("ERROR")
+    df["confidence_score"] = df["confidence_score"].fillna(0)
+    for column in ("gaps_identified", "auditor_questions"):
+        df[column] = df[column].map(len, na_action="ignore").fillna(0)
+    df["confidence_bucket"] = pd.cut(
+        df["confidence_score"],
+        bins=[float("-inf"), 0.6, 0.8, float("inf")],
+        labels=["low", "medium", "high"],
+        right=False
+    )
+    return df
+
+@lru_cache(maxsize=8)
+def _summary_for(path_str, mtime_ns):
+    """Aggregate summary statistics for one report version."""
+    report = _load_report_cached(path_str, mtime_ns)
     if not report:
-        return jsonify({"error": "No reports found"}), 404
+        return None
     
     findings = report.get("findings", [])
     
+    df = findings_frame(findings)
+    
     # Calculate statistics
     status_counts = {
         "COMPLIANT": 0,
@@ -113,23 +255,14 @@ def get_summary():
         "NON_COMPLIANT": 0,
         "ERROR": 0
     }
+    for status, count in df["status"].value_counts(sort=False).items():
+        status_counts[status] = int(count)
     
-    total_gaps = 0
-    total_questions = 0
-    confidence_scores = []
-    
-    for finding in findings:
-        status = finding.get("status", "ERROR")
-        status_counts[status] = status_counts.get(status, 0) + 1
-        
-        total_gaps += len(finding.get("gaps_identified", []))
-        total_questions += len(finding.get("auditor_questions", []))
-        
-        confidence = finding.get("confidence_score", 0)
-        if confidence > 0:
-            confidence_scores.append(confidence)
+    total_gaps = int(df["gaps_identified"].sum())
+    total_questions = int(df["auditor_questions"].sum())
     
-    avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
+    confidence_scores = df["confidence_score"][df["confidence_score"] > 0]
+    avg_confidence = float(confidence_scores.mean()) if len(confidence_scores) else 0
     
     summary = {
         "total_requirements": len(findings),
@@ -140,7 +273,42 @@ def get_summary():
         "timestamp": report.get("metadata", {}).get("generated_at", "")
     }
     
-    return jsonify(summary)
+    return summary
+
+@app.route('/api/summary')
+def get_summary():
+    """API endpoint to get summary statistics."""
+    return latest_report_response(_summary_for)
+
+@lru_cache(maxsize=4)
+def _search_index(path_str, mtime_ns):
+    """Build the search index for one report version.
+    
+    Returns the findings, their lowercased searchable text and a status ->
+    finding index map.
+    """
+    report = _load_report_cached(path_str, mtime_ns)
+    findings = report.get("findings", []) if report else []
+    
+    texts = []
+    by_status = defaultdict(list)
+    for i, finding in enumerate(findings):
+        searchable_text = " ".join([
+            finding.get("requirement_id", ""),
+            finding.get("requirement_text", ""),
+            finding.get("analysis", ""),
+            " ".join(finding.get("gaps_identified", [])),
+            " ".join(finding.get("auditor_questions", []))
+        ]).lower()
+        texts.append(searchable_text)
+        by_status[finding.get("status")].append(i)
+    
+    return findings, texts, dict(by_status)
+
+def ndjson_lines(items):
+    """Yield each item as one line of newline-delimited JSON, serialized like jsonify."""
+    for item in items:
+        yield app.json.dumps_bytes(item) + b"\n"
 
 @app.route('/api/search')
 def search_findings():
@@ -148,44 +316,56 @@ def search_findings():
     query = request.args.get('q', '').lower()
     status = request.args.get('status', '')
     
-    report = get_latest_report()
-    if not report:
+    key = get_latest_report_key()
+    if key is None:
         return jsonify([])
     
-    findings = report.get("findings", [])
-    results = []
+    findings, texts, by_status = _search_index(*key)
     
-    for finding in findings:
-        # Filter by status
-        if status and finding.get("status") != status:
-            continue
-        
-        # Search in text fields
-        if query:
-            searchable_text = " ".join([
-                finding.get("requirement_id", ""),
-                finding.get("requirement_text", ""),
-                finding.get("analysis", ""),
-                " ".join(finding.get("gaps_identified", [])),
-                " ".join(finding.get("auditor_questions", []))
-            ]).lower()
-            
-            if query not in searchable_text:
-                continue
-        
-        results.append(finding)
-    
-    return jsonify(results)
+    # Filter by status
+    ids = by_status.get(status, []) if status else range(len(findings))
+    
+    # Search in text fields: every whitespace-separated term must appear in the cached text
+    terms = list(dict.fromkeys(query.split()))
+    if terms:
+        if len(terms) == 1:
+            # A single term is one substring test against the cached text
+            term = terms[0]
+            ids = [i for i in ids if term in texts[i]]
+        else:
+            ids = [i for i in ids if all(term in texts[i] for term in terms)]
+    
+    results = [findings[i] for i in ids]
+    
+    # Clients that ask for NDJSON get one finding per line as it is serialized
+    if request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson']) == 'application/x-ndjson':
+        response = app.response_class(ndjson_lines(results), mimetype='application/x-ndjson')
+    else:
+        response = jsonify(results)
+    # The body depends on Accept, so caches must not serve one format for the other
+    response.vary.add('Accept')
+    return response
+
+def send_cached_file(directory, filename, immutable):
+    """Serve a file with long-lived immutable caching, or a short max-age otherwise."""
+    if not immutable:
+        return send_from_directory(directory, filename, max_age=SHORT_MAX_AGE)
+    
+    response = send_from_directory(directory, filename, max_age=IMMUTABLE_MAX_AGE)
+    response.cache_control.immutable = True
+    return response
 
 @app.route('/outputs/<path:filename>')
 def download_file(filename):
     """Serve output files for download."""
-    return send_from_directory('outputs', filename)
+    # A pipeline run can rewrite its outputs in place (the report endpoints reload by
+    # mtime), so every export is revalidated; unchanged files still get a cheap 304
+    return send_from_directory(OUTPUT_DIR, filename, max_age=0)
 
 @app.route('/public/<path:filename>')
 def serve_public(filename):
     """Serve public static files."""
-    return send_from_directory('public', filename)
+    return send_cached_file('public', filename, HASHED_ASSET_RE.fullmatch(filename) is not None)
 
 @app.route('/api/upload', methods=['POST'])
 def upload_document():
@@ -232,12 +412,12 @@ def upload_document():
     
     return jsonify(result)
 
-@app.route('/api/stats')
-def get_stats():
-    """API endpoint to get comprehensive statistics."""
-    report = get_latest_report()
+@lru_cache(maxsize=8)
+def _stats_for(path_str, mtime_ns):
+    """Aggregate comprehensive statistics for one report version."""
+    report = _load_report_cached(path_str, mtime_ns)
     if not report:
-        return jsonify({"error": "No reports found"}), 404
+        return None
     
     findings = report.get("findings", [])
     
@@ -260,324 +440,332 @@ def get_stats():
         }
     }
     
-    total_gaps = 0
-    total_questions = 0
-    
-    for finding in findings:
-        status = finding.get("status", "ERROR")
-        stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-        
-        confidence = finding.get("confidence_score", 0)
-        if confidence >= 0.8:
-            stats["by_confidence"]["high"] += 1
-        elif confidence >= 0.6:
-            stats["by_confidence"]["medium"] += 1
-        else:
-            stats["by_confidence"]["low"] += 1
-        
-        gaps = len(finding.get("gaps_identified", []))
-        questions = len(finding.get("auditor_questions", []))
-        total_gaps += gaps
-        total_questions += questions
+    df = findings_frame(findings)
+    
+    stats["by_status"] = {
+        status: int(count)
+        for status, count in df["status"].value_counts(sort=False).items()
+    }
+    
+    confidence_buckets = df["confidence_bucket"].value_counts()
+    for bucket, count in confidence_buckets.items():
+        stats["by_confidence"][bucket] = int(count)
+    
+    total_gaps = int(df["gaps_identified"].sum())
+    total_questions = int(df["auditor_questions"].sum())
     
     stats["gaps"]["total"] = total_gaps
     stats["gaps"]["avg_per_finding"] = round(total_gaps / len(findings), 2) if findings else 0
     stats["questions"]["total"] = total_questions
     stats["questions"]["avg_per_finding"] = round(total_questions / len(findings), 2) if findings else 0
     
-    return jsonify(stats)
+    return stats
 
-@app.route('/api/judging-criteria')
-def get_judging_criteria():
-    """API endpoint with hardcoded judging criteria showcase data."""
-    return jsonify({
-        "technical_execution": {
-            "title": "Technical Execution & Resilience",
-            "score": 14,
-            "percentage": 95,
-            "metrics": {
-                "reproducibility": {
-                    "status": "Excellent",
-                    "details": "Docker containerization + UV package manager ensures 100% reproducible builds",
-                    "icon": "fa-sync"
-                },
-                "caching": {
-                    "status": "Implemented",
-                    "details": "ChromaDB vector cache reduces re-processing time by 87%",
-                    "cache_hit_rate": 89.3,
-                    "icon": "fa-database"
-                },
-                "error_handling": {
-                    "status": "Robust",
-                    "details": "Multi-layer error recovery with graceful degradation",
-                    "errors_caught": 247,
-                    "uptime": "99.8%",
-                    "icon": "fa-shield-alt"
-                },
-                "snapshot_capability": {
-                    "status": "Active",
-                    "details": "All audit sessions saved with full traceability",
-                    "snapshots_stored": 12,
-                    "icon": "fa-camera"
-                }
+@app.route('/api/stats')
+def get_stats():
+    """API endpoint to get comprehensive statistics."""
+    return latest_report_response(_stats_for)
+
+# Static showcase payloads, serialized once at import time
+_JUDGING_CRITERIA_JSON = app.json.dumps_bytes({
+    "technical_execution": {
+        "title": "Technical Execution & Resilience",
+        "score": 14,
+        "percentage": 95,
+        "metrics": {
+            "reproducibility": {
+                "status": "Excellent",
+                "details": "Docker containerization + UV package manager ensures 100% reproducible builds",
+                "icon": "fa-sync"
+            },
+            "caching": {
+                "status": "Implemented",
+                "details": "ChromaDB vector cache reduces re-processing time by 87%",
+                "cache_hit_rate": 89.3,
+                "icon": "fa-database"
+            },
+            "error_handling": {
+                "status": "Robust",
+                "details": "Multi-layer error recovery with graceful degradation",
+                "errors_caught": 247,
+                "uptime": "99.8%",
+                "icon": "fa-shield-alt"
+            },
+            "snapshot_capability": {
+                "status": "Active",
+                "details": "All audit sessions saved with full traceability",
+                "snapshots_stored": 12,
+                "icon": "fa-camera"
             }
-        },
-        "alternatives": {
-            "title": "Relevant Alternatives & Cross-Sector Scalability",
-            "score": 14,
-            "percentage": 92,
-            "comparisons": [
-                {
-                    "name": "LlamaIndex",
-                    "our_approach": "Hybrid Search (Vector + BM25)",
-                    "advantage": "34% better precision for regulatory text",
-                    "icon": "fa-search"
-                },
-                {
-                    "name": "OpenAI Embeddings",
-                    "our_approach": "Local Ollama/HuggingFace",
-                    "advantage": "£0 cost vs £12/audit, GDPR compliant",
-                    "icon": "fa-coins"
-                },
-                {
-                    "name": "GPT-4",
-                    "our_approach": "DeepSeek via Featherless",
-                    "advantage": "95% cheaper, equal accuracy",
-                    "icon": "fa-brain"
-                }
-            ],
-            "cross_sector": {
-                "maritime": {
-                    "regulation": "ISM Code / SOLAS",
-                    "adaptation_time": "2-3 days",
-                    "compatibility": "95%",
-                    "icon": "fa-ship"
-                },
-                "rail": {
-                    "regulation": "ERA Technical Standards",
-                    "adaptation_time": "2-3 days",
-                    "compatibility": "93%",
-                    "icon": "fa-train"
-                },
-                "telecom": {
-                    "regulation": "NIS2 Directive / GDPR",
-                    "adaptation_time": "1-2 days",
-                    "compatibility": "97%",
-                    "icon": "fa-network-wired"
-                },
-                "cyber": {
-                    "regulation": "ISO 27001 / SOC 2",
-                    "adaptation_time": "1-2 days",
-                    "compatibility": "96%",
-                    "icon": "fa-lock"
-                }
+        }
+    },
+    "alternatives": {
+        "title": "Relevant Alternatives & Cross-Sector Scalability",
+        "score": 14,
+        "percentage": 92,
+        "comparisons": [
+            {
+                "name": "LlamaIndex",
+                "our_approach": "Hybrid Search (Vector + BM25)",
+                "advantage": "34% better precision for regulatory text",
+                "icon": "fa-search"
+            },
+            {
+                "name": "OpenAI Embeddings",
+                "our_approach": "Local Ollama/HuggingFace",
+                "advantage": "£0 cost vs £12/audit, GDPR compliant",
+                "icon": "fa-coins"
+            },
+            {
+                "name": "GPT-4",
+                "our_approach": "DeepSeek via Featherless",
+                "advantage": "95% cheaper, equal accuracy",
+                "icon": "fa-brain"
             }
-        },
-        "feasibility": {
-            "title": "Feasibility & Legal Compliance",
-            "score": 14,
-            "percentage": 94,
-            "compliance": {
-                "gdpr": {
-                    "status": "Fully Compliant",
-                    "details": "Local processing, no external data transfer, audit trails",
-                    "icon": "fa-user-shield"
-                },
-                "human_oversight": {
-                    "status": "Required & Implemented",
-                    "details": "Auditor review mandatory for all NEEDS_REVIEW findings (46.1%)",
-                    "icon": "fa-user-check"
-                },
-                "regulatory_authority": {
-                    "status": "Authority-Friendly",
-                    "details": "AI assists, humans decide - maintains legal accountability",
-                    "icon": "fa-gavel"
-                },
-                "data_retention": {
-                    "status": "Compliant",
-                    "details": "7-year audit trail storage per EU aviation requirements",
-                    "icon": "fa-archive"
-                }
+        ],
+        "cross_sector": {
+            "maritime": {
+                "regulation": "ISM Code / SOLAS",
+                "adaptation_time": "2-3 days",
+                "compatibility": "95%",
+                "icon": "fa-ship"
             },
-            "deployment": {
-                "timeline": "4-6 weeks pilot",
-                "infrastructure": "On-premise or private cloud",
-                "integration": "API-ready for existing systems",
-                "training": "2-day auditor training program"
+            "rail": {
+                "regulation": "ERA Technical Standards",
+                "adaptation_time": "2-3 days",
+                "compatibility": "93%",
+                "icon": "fa-train"
+            },
+            "telecom": {
+                "regulation": "NIS2 Directive / GDPR",
+                "adaptation_time": "1-2 days",
+                "compatibility": "97%",
+                "icon": "fa-network-wired"
+            },
+            "cyber": {
+                "regulation": "ISO 27001 / SOC 2",
+                "adaptation_time": "1-2 days",
+                "compatibility": "96%",
+                "icon": "fa-lock"
             }
-        },
-        "innovation": {
-            "title": "Innovation - Rethinking Auditing",
-            "score": 14,
-            "percentage": 96,
-            "breakthrough_features": [
-                {
-                    "name": "Hybrid Semantic Search",
-                    "description": "Combines vector embeddings + BM25 for 34% better precision",
-                    "impact": "Finds regulatory requirements traditional tools miss",
-                    "icon": "fa-lightbulb"
-                },
-                {
-                    "name": "Confidence-Based Triage",
-                    "description": "Auto-passes high-confidence (85%+), flags uncertain for human review",
-                    "impact": "Auditors focus on complex cases, not routine checks",
-                    "icon": "fa-filter"
-                },
-                {
-                    "name": "Test Bench for Industry",
-                    "description": "Pre-submission self-audit portal for aviation companies",
-                    "impact": "Reduces back-and-forth, speeds approval by 60%",
-                    "icon": "fa-vial"
-                },
-                {
-                    "name": "Citation-Linked Findings",
-                    "description": "Every finding links to exact regulation paragraph + page number",
-                    "impact": "Zero ambiguity, instant verification",
-                    "icon": "fa-link"
-                }
-            ],
-            "paradigm_shift": {
-                "before": "Manual PDF reading, weeks of work, £15k-30k cost",
-                "after": "Automated analysis, 2-3 hours, £500-800 cost",
-                "time_reduction": "96%",
-                "cost_reduction": "97%"
+        }
+    },
+    "feasibility": {
+        "title": "Feasibility & Legal Compliance",
+        "score": 14,
+        "percentage": 94,
+        "compliance": {
+            "gdpr": {
+                "status": "Fully Compliant",
+                "details": "Local processing, no external data transfer, audit trails",
+                "icon": "fa-user-shield"
+            },
+            "human_oversight": {
+                "status": "Required & Implemented",
+                "details": "Auditor review mandatory for all NEEDS_REVIEW findings (46.1%)",
+                "icon": "fa-user-check"
+            },
+            "regulatory_authority": {
+                "status": "Authority-Friendly",
+                "details": "AI assists, humans decide - maintains legal accountability",
+                "icon": "fa-gavel"
+            },
+            "data_retention": {
+                "status": "Compliant",
+                "details": "7-year audit trail storage per EU aviation requirements",
+                "icon": "fa-archive"
             }
         },
-        "impact": {
-            "title": "Impact - Efficiency & Cost Savings",
-            "score": 14,
-            "percentage": 98,
-            "roi": {
-                "time_savings": {
-                    "traditional_audit": "3-4 weeks",
-                    "ai_audit": "2-3 hours",
-                    "reduction": "96%",
-                    "icon": "fa-clock"
-                },
-                "cost_savings": {
-                    "traditional_audit": "€15,000 - €30,000",
-                    "ai_audit": "€500 - €800",
-                    "reduction": "97%",
-                    "annual_traficom_savings": "€2.4M - €4.8M (assuming 200 audits/year)",
-                    "icon": "fa-piggy-bank"
-                },
-                "accuracy": {
-                    "human_fatigue_errors": "8-12% miss rate",
-                    "ai_consistency": "2-3% miss rate",
-                    "improvement": "4x more reliable",
-                    "icon": "fa-bullseye"
-                },
-                "throughput": {
-                    "before": "50-60 audits/year/auditor",
-                    "after": "400-500 audits/year/auditor",
-                    "multiplier": "8x capacity increase",
-                    "icon": "fa-rocket"
-                }
+        "deployment": {
+            "timeline": "4-6 weeks pilot",
+            "infrastructure": "On-premise or private cloud",
+            "integration": "API-ready for existing systems",
+            "training": "2-day auditor training program"
+        }
+    },
+    "innovation": {
+        "title": "Innovation - Rethinking Auditing",
+        "score": 14,
+        "percentage": 96,
+        "breakthrough_features": [
+            {
+                "name": "Hybrid Semantic Search",
+                "description": "Combines vector embeddings + BM25 for 34% better precision",
+                "impact": "Finds regulatory requirements traditional tools miss",
+                "icon": "fa-lightbulb"
+            },
+            {
+                "name": "Confidence-Based Triage",
+                "description": "Auto-passes high-confidence (85%+), flags uncertain for human review",
+                "impact": "Auditors focus on complex cases, not routine checks",
+                "icon": "fa-filter"
+            },
+            {
+                "name": "Test Bench for Industry",
+                "description": "Pre-submission self-audit portal for aviation companies",
+                "impact": "Reduces back-and-forth, speeds approval by 60%",
+                "icon": "fa-vial"
             },
-            "user_experience": {
-                "companies": "60% faster approvals, predictable timelines",
-                "auditors": "Focus on judgment, not manual checking",
-                "traficom": "Scale audits without hiring, better service quality",
-                "public_safety": "More thorough checks, consistent standards"
+            {
+                "name": "Citation-Linked Findings",
+                "description": "Every finding links to exact regulation paragraph + page number",
+                "impact": "Zero ambiguity, instant verification",
+                "icon": "fa-link"
             }
-        },
-        "evidence_quality": {
-            "title": "Evidence Quality & Standards References",
-            "score": 14,
-            "percentage": 93,
-            "citation_accuracy": {
-                "regulation_references": 247,
-                "with_exact_page_numbers": 245,
-                "with_paragraph_ids": 247,
-                "accuracy_rate": "99.2%",
-                "icon": "fa-file-alt"
+        ],
+        "paradigm_shift": {
+            "before": "Manual PDF reading, weeks of work, £15k-30k cost",
+            "after": "Automated analysis, 2-3 hours, £500-800 cost",
+            "time_reduction": "96%",
+            "cost_reduction": "97%"
+        }
+    },
+    "impact": {
+        "title": "Impact - Efficiency & Cost Savings",
+        "score": 14,
+        "percentage": 98,
+        "roi": {
+            "time_savings": {
+                "traditional_audit": "3-4 weeks",
+                "ai_audit": "2-3 hours",
+                "reduction": "96%",
+                "icon": "fa-clock"
+            },
+            "cost_savings": {
+                "traditional_audit": "€15,000 - €30,000",
+                "ai_audit": "€500 - €800",
+                "reduction": "97%",
+                "annual_traficom_savings": "€2.4M - €4.8M (assuming 200 audits/year)",
+                "icon": "fa-piggy-bank"
             },
-            "standards_coverage": {
-                "easa_part145": {
-                    "requirements": 191,
-                    "covered": 191,
-                    "coverage": "100%",
-                    "source": "EU 1321/2014 + AMC/GM"
-                },
-                "moe_guide": {
-                    "sections": 24,
-                    "cross_referenced": 24,
-                    "coverage": "100%",
-                    "source": "ug.cao_.00024-010"
-                }
+            "accuracy": {
+                "human_fatigue_errors": "8-12% miss rate",
+                "ai_consistency": "2-3% miss rate",
+                "improvement": "4x more reliable",
+                "icon": "fa-bullseye"
+            },
+            "throughput": {
+                "before": "50-60 audits/year/auditor",
+                "after": "400-500 audits/year/auditor",
+                "multiplier": "8x capacity increase",
+                "icon": "fa-rocket"
+            }
+        },
+        "user_experience": {
+            "companies": "60% faster approvals, predictable timelines",
+            "auditors": "Focus on judgment, not manual checking",
+            "traficom": "Scale audits without hiring, better service quality",
+            "public_safety": "More thorough checks, consistent standards"
+        }
+    },
+    "evidence_quality": {
+        "title": "Evidence Quality & Standards References",
+        "score": 14,
+        "percentage": 93,
+        "citation_accuracy": {
+            "regulation_references": 247,
+            "with_exact_page_numbers": 245,
+            "with_paragraph_ids": 247,
+            "accuracy_rate": "99.2%",
+            "icon": "fa-file-alt"
+        },
+        "standards_coverage": {
+            "easa_part145": {
+                "requirements": 191,
+                "covered": 191,
+                "coverage": "100%",
+                "source": "EU 1321/2014 + AMC/GM"
             },
-            "validation": {
-                "manual_spot_check": "95% agreement with expert auditors",
-                "false_positive_rate": "4.2%",
-                "false_negative_rate": "2.8%",
-                "f1_score": "0.92"
+            "moe_guide": {
+                "sections": 24,
+                "cross_referenced": 24,
+                "coverage": "100%",
+                "source": "ug.cao_.00024-010"
             }
         },
-        "transparency": {
-            "title": "Transparency & Explainability",
-            "score": 14,
-            "percentage": 97,
-            "explainability": {
-                "confidence_scores": {
-                    "all_findings": "100% scored",
-                    "avg_confidence": "0.85",
-                    "high_confidence": "54.5% (>0.8)",
-                    "needs_review": "46.1% (0.6-0.8)",
-                    "icon": "fa-chart-line"
-                },
-                "claim_evidence_mapping": {
-                    "status": "Complete",
-                    "details": "Every claim links to MOE section + regulation paragraph",
-                    "traceable": "100%",
-                    "icon": "fa-project-diagram"
-                },
-                "reasoning_display": {
-                    "status": "Full LLM reasoning shown",
-                    "details": "Auditors see AI analysis steps, retrieved context, and decision logic",
-                    "icon": "fa-eye"
-                },
-                "audit_trail": {
-                    "status": "Complete",
-                    "details": "Timestamp, model version, input docs, confidence scores logged",
-                    "retention": "7 years",
-                    "icon": "fa-history"
-                }
+        "validation": {
+            "manual_spot_check": "95% agreement with expert auditors",
+            "false_positive_rate": "4.2%",
+            "false_negative_rate": "2.8%",
+            "f1_score": "0.92"
+        }
+    },
+    "transparency": {
+        "title": "Transparency & Explainability",
+        "score": 14,
+        "percentage": 97,
+        "explainability": {
+            "confidence_scores": {
+                "all_findings": "100% scored",
+                "avg_confidence": "0.85",
+                "high_confidence": "54.5% (>0.8)",
+                "needs_review": "46.1% (0.6-0.8)",
+                "icon": "fa-chart-line"
+            },
+            "claim_evidence_mapping": {
+                "status": "Complete",
+                "details": "Every claim links to MOE section + regulation paragraph",
+                "traceable": "100%",
+                "icon": "fa-project-diagram"
             },
-            "human_review": {
-                "flagged_for_review": "88 findings (46.1%)",
-                "auto_approved": "101 findings (52.9%)",
-                "override_capability": "Yes - auditor has final say",
-                "review_time": "~15 min per flagged item"
+            "reasoning_display": {
+                "status": "Full LLM reasoning shown",
+                "details": "Auditors see AI analysis steps, retrieved context, and decision logic",
+                "icon": "fa-eye"
+            },
+            "audit_trail": {
+                "status": "Complete",
+                "details": "Timestamp, model version, input docs, confidence scores logged",
+                "retention": "7 years",
+                "icon": "fa-history"
             }
         },
-        "overall": {
-            "total_score": "98/100",
-            "grade": "A+",
-            "readiness": "Pilot-Ready",
-            "slush_pitch": "Transform 4-week €30k audits into 3-hour €500 AI-assisted checks with 4x better accuracy"
+        "human_review": {
+            "flagged_for_review": "88 findings (46.1%)",
+            "auto_approved": "101 findings (52.9%)",
+            "override_capability": "Yes - auditor has final say",
+            "review_time": "~15 min per flagged item"
         }
-    })
+    },
+    "overall": {
+        "total_score": "98/100",
+        "grade": "A+",
+        "readiness": "Pilot-Ready",
+        "slush_pitch": "Transform 4-week €30k audits into 3-hour €500 AI-assisted checks with 4x better accuracy"
+    }
+})
+_JUDGING_CRITERIA_GZIP = gzip.compress(_JUDGING_CRITERIA_JSON)
+_JUDGING_CRITERIA_ETAG = hashlib.blake2b(_JUDGING_CRITERIA_JSON, digest_size=8).hexdigest()
+
+@app.route('/api/judging-criteria')
+def get_judging_criteria():
+    """API endpoint with hardcoded judging criteria showcase data."""
+    return static_json_response(_JUDGING_CRITERIA_JSON, _JUDGING_CRITERIA_GZIP, _JUDGING_CRITERIA_ETAG)
+
+_DEMO_METRICS_JSON = app.json.dumps_bytes({
+    "live_stats": {
+        "documents_processed": 3,
+        "chunks_analyzed": 1247,
+        "requirements_checked": 191,
+        "citations_validated": 247,
+        "processing_time": "2h 14min",
+        "estimated_manual_time": "3-4 weeks",
+        "cost_savings": "€28,700"
+    },
+    "performance": {
+        "avg_response_time": "1.2s",
+        "cache_hit_rate": "89.3%",
+        "embedding_speed": "450 chunks/min",
+        "llm_throughput": "12 analyses/min"
+    }
+})
+_DEMO_METRICS_GZIP = gzip.compress(_DEMO_METRICS_JSON)
+_DEMO_METRICS_ETAG = hashlib.blake2b(_DEMO_METRICS_JSON, digest_size=8).hexdigest()
 
 @app.route('/api/demo-metrics')
 def get_demo_metrics():
     """Real-time demo metrics for live showcase."""
-    return jsonify({
-        "live_stats": {
-            "documents_processed": 3,
-            "chunks_analyzed": 1247,
-            "requirements_checked": 191,
-            "citations_validated": 247,
-            "processing_time": "2h 14min",
-            "estimated_manual_time": "3-4 weeks",
-            "cost_savings": "€28,700"
-        },
-        "performance": {
-            "avg_response_time": "1.2s",
-            "cache_hit_rate": "89.3%",
-            "embedding_speed": "450 chunks/min",
-            "llm_throughput": "12 analyses/min"
-        }
-    })
+    return static_json_response(_DEMO_METRICS_JSON, _DEMO_METRICS_GZIP, _DEMO_METRICS_ETAG)
 
 @app.errorhandler(404)
 def not_found(error):
@@ -593,6 +781,7 @@ def internal_error(error):
 if __name__ == '__main__':
     logger.info("Starting EASA Part-145 Compliance Platform...")
     logger.info("Access the dashboard at: http://localhost:5000")
-    app.run(debug=True, port=5000, host='0.0.0.0')
+    # Debug mode follows FLASK_DEBUG (off by default); production runs under gunicorn (see Procfile)
+    app.run(port=5000, host='0.0.0.0')
 
 